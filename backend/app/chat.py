@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, AsyncIterator
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable
 
 from agents import Runner
 from chatkit.agents import (
@@ -12,6 +15,7 @@ from chatkit.agents import (
     stream_agent_response,
 )
 from chatkit.server import ChatKitServer
+from chatkit.store import NotFoundError
 from chatkit.types import (
     Attachment,
     ClientToolCallItem,
@@ -22,23 +26,42 @@ from chatkit.types import (
 )
 from openai.types.responses import ResponseInputContentParam
 
+from .config import INCLUDE_THREAD_HISTORY
 from .pharmacist import create_pharmacist_agent
 from .psychologist import create_psychologist_agent
 from .supervisor import create_supervisor_agent
 from .memory_store import MemoryStore
 
 
+# Number of most recent thread items the agent's history is built from each turn
+_HISTORY_LIMIT = 100
+# Maximum number of threads whose converted history is kept in memory
+_HISTORY_CACHE_THREADS = 64
+
+
+@dataclass
+class _ThreadHistory:
+    """Converted conversation history of a thread, extended incrementally each turn."""
+
+    # (item id, converted message or None) for the most recent items, oldest first.
+    # Bounded by item count so a warm cache and a rebuild cover the same items.
+    entries: deque[tuple[str, Any | None]] = field(
+        default_factory=lambda: deque(maxlen=_HISTORY_LIMIT)
+    )
+    last_item_id: str | None = None
+    last_created_at: datetime | None = None
+
+
 def _is_tool_completion_item(item: Any) -> bool:
     return isinstance(item, ClientToolCallItem)
 
 
+def _join_text_parts(parts: Iterable[Any]) -> str:
+    return " ".join(text for part in parts if (text := getattr(part, "text", None))).strip()
+
+
 def _user_message_text(item: UserMessageItem) -> str:
-    parts: list[str] = []
-    for part in item.content:
-        text = getattr(part, "text", None)
-        if text:
-            parts.append(text)
-    return " ".join(parts).strip()
+    return _join_text_parts(item.content)
 
 
 def _extract_message_text(item: ThreadItem) -> str | None:
@@ -50,29 +73,41 @@ def _extract_message_text(item: ThreadItem) -> str | None:
     if hasattr(item, "content"):
         content = item.content
         if isinstance(content, list):
-            parts: list[str] = []
-            for part in content:
-                text = getattr(part, "text", None)
-                if text:
-                    parts.append(text)
-            result = " ".join(parts).strip()
-            return result if result else None
+            return _join_text_parts(content) or None
         elif isinstance(content, str):
             return content.strip() if content.strip() else None
     
     return None
 
 
+def _resolve_converter_content_kwarg() -> str | None:
+    """Find the constructor keyword ``ThreadItemConverter`` takes for attachment content."""
+    try:
+        params = inspect.signature(ThreadItemConverter).parameters
+    except (TypeError, ValueError):
+        return None
+
+    for name in ("to_message_content", "message_content_converter"):
+        if name in params:
+            return name
+    return None
+
+
+_CONVERTER_CONTENT_KWARG = _resolve_converter_content_kwarg()
+
+
 class HealthCoachServer(ChatKitServer[dict[str, Any]]):
     """Health Coach server with multi-agent setup for specialized health support."""
 
     def __init__(self) -> None:
-        self.store = MemoryStore()
+        self._history_cache: OrderedDict[str, _ThreadHistory] = OrderedDict()
+        self.store = MemoryStore(on_thread_deleted=self._forget_thread_history)
         super().__init__(self.store)
         pharmacist = create_pharmacist_agent()
         psychologist = create_psychologist_agent()
         self.assistant = create_supervisor_agent([pharmacist, psychologist])
         self._thread_item_converter = self._init_thread_item_converter()
+        self._convert_item = self._bind_convert_item()
 
     async def respond(
         self,
@@ -93,8 +128,11 @@ class HealthCoachServer(ChatKitServer[dict[str, Any]]):
         if target_item is None or _is_tool_completion_item(target_item):
             return
 
-        # Load full conversation history and convert to agent input
-        agent_input = await self._to_agent_input_with_history(thread, target_item, context)
+        if INCLUDE_THREAD_HISTORY:
+            # Load full conversation history and convert to agent input
+            agent_input = await self._to_agent_input_with_history(thread, target_item, context)
+        else:
+            agent_input = await self._to_agent_input(thread, target_item)
         if agent_input is None:
             return
 
@@ -114,15 +152,52 @@ class HealthCoachServer(ChatKitServer[dict[str, Any]]):
         if not callable(ThreadItemConverter):
             return None
 
-        for kwargs in (
-            {"to_message_content": self.to_message_content},
-            {"message_content_converter": self.to_message_content},
-            {},
-        ):
-            try:
-                return ThreadItemConverter(**kwargs)
-            except TypeError:
+        kwargs: dict[str, Any] = {}
+        if _CONVERTER_CONTENT_KWARG:
+            kwargs[_CONVERTER_CONTENT_KWARG] = self.to_message_content
+        try:
+            return ThreadItemConverter(**kwargs)
+        except TypeError:
+            if not kwargs:
+                return None
+
+        # The keyword was rejected after all; fall back to the default converter
+        try:
+            return ThreadItemConverter()
+        except TypeError:
+            return None
+
+    def _bind_convert_item(self) -> Callable[[ThreadItem, ThreadMetadata], Any] | None:
+        """Bind the converter method once, with its calling convention baked in."""
+        converter = self._thread_item_converter
+        if not converter:
+            return None
+
+        for method_name in ("to_input_item", "convert", "convert_item", "convert_thread_item"):
+            method = getattr(converter, method_name, None)
+            if not method:
                 continue
+
+            # Inspect the bound method so ``self`` is already excluded
+            try:
+                sig = inspect.signature(method)
+            except (TypeError, ValueError):
+                return lambda item, _thread: method(item)
+
+            params = [
+                p for p in sig.parameters.values()
+                if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+            ]
+            if len(params) < 2:
+                return lambda item, _thread: method(item)
+            if params[1].kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                return method
+
+            thread_param = params[1].name
+            return lambda item, thread: method(item, **{thread_param: thread})
         return None
 
     async def _latest_thread_item(
@@ -130,9 +205,9 @@ class HealthCoachServer(ChatKitServer[dict[str, Any]]):
     ) -> ThreadItem | None:
         try:
             items = await self.store.load_thread_items(thread.id, None, 1, "desc", context)
-            return items.data[0] if items.data else None
-        except Exception:
+        except NotFoundError:
             return None
+        return items.data[0] if items.data else None
 
     async def _to_agent_input_with_history(
         self,
@@ -144,45 +219,100 @@ class HealthCoachServer(ChatKitServer[dict[str, Any]]):
         if _is_tool_completion_item(current_item):
             return None
 
-        # Load all thread items for full conversation history
-        try:
-            all_items_page = await self.store.load_thread_items(thread.id, None, 100, "asc", context)
-            all_items = all_items_page.data if all_items_page.data else []
-        except Exception:
-            all_items = []
+        history = self._history_cache.get(thread.id)
+        if history is not None:
+            self._history_cache.move_to_end(thread.id)
+        new_items = (
+            await self._load_history_delta(thread, history, current_item, context)
+            if history is not None
+            else None
+        )
+        if history is None or new_items is None:
+            history = self._history_cache[thread.id] = _ThreadHistory()
+            if len(self._history_cache) > _HISTORY_CACHE_THREADS:
+                self._history_cache.popitem(last=False)
+            new_items = await self._load_recent_history(thread, context)
+
+        # Convert only the items added since the last turn
+        for item in new_items:
+            converted = await self._to_agent_input(thread, item)
+            history.entries.append((item.id, self._history_message(item, converted)))
 
-        # Filter out tool completion items
-        conversation_items = [item for item in all_items if not _is_tool_completion_item(item)]
+        if new_items:
+            history.last_item_id = new_items[-1].id
+            history.last_created_at = new_items[-1].created_at
 
-        if not conversation_items:
+        history_messages = [message for _, message in history.entries if message is not None]
+        if not history_messages:
             return await self._to_agent_input(thread, current_item)
 
-        # Convert all items to agent input format
-        messages = []
-        
-        for item in conversation_items:
-            converted = await self._to_agent_input(thread, item)
-            if converted is not None:
-                # If converter returned a string, convert it to proper message format
-                if isinstance(converted, str):
-                    # Determine role based on item type
-                    role = "user" if isinstance(item, UserMessageItem) else "assistant"
-                    messages.append({"role": role, "content": converted})
-                else:
-                    # Converter returned a proper object, use it as-is
-                    messages.append(converted)
-            else:
-                # Converter didn't work, try extracting text directly
-                text = _extract_message_text(item)
-                if text:
-                    role = "user" if isinstance(item, UserMessageItem) else "assistant"
-                    messages.append({"role": role, "content": text})
-
-        if not messages:
+        # Always return the full history as a list
+        return history_messages
+
+    @staticmethod
+    def _history_message(item: ThreadItem, converted: Any | None) -> Any | None:
+        """Turn a converted item into a history message, or None if it has no content."""
+        if _is_tool_completion_item(item):
             return None
 
-        # Always return the full history as a list
-        return messages
+        if converted is None:
+            # Converter didn't work, try extracting text directly
+            converted = _extract_message_text(item)
+            if not converted:
+                return None
+
+        if isinstance(converted, str):
+            # Convert plain text to proper message format, with the role based on item type
+            role = "user" if isinstance(item, UserMessageItem) else "assistant"
+            return {"role": role, "content": converted}
+
+        # Converter returned a proper object, use it as-is
+        return converted
+
+    def _forget_thread_history(self, thread_id: str) -> None:
+        self._history_cache.pop(thread_id, None)
+
+    async def _load_history_delta(
+        self,
+        thread: ThreadMetadata,
+        history: _ThreadHistory,
+        current_item: ThreadItem,
+        context: dict[str, Any],
+    ) -> list[ThreadItem] | None:
+        """Load the items added after the cached history, or None if it must be rebuilt."""
+        try:
+            page = await self.store.load_thread_items(
+                thread.id, history.last_item_id, _HISTORY_LIMIT, "asc", context
+            )
+        except NotFoundError:
+            return None
+
+        # A known or older item showing up again means the thread was rewound (e.g. a retry)
+        item_ids = {item_id for item_id, _ in history.entries}
+        last_created_at = history.last_created_at
+        if (
+            page.has_more
+            or current_item.id in item_ids
+            or any(item.id in item_ids for item in page.data)
+            or (
+                last_created_at is not None
+                and any(item.created_at < last_created_at for item in page.data)
+            )
+        ):
+            return None
+        return page.data
+
+    async def _load_recent_history(
+        self, thread: ThreadMetadata, context: dict[str, Any]
+    ) -> list[ThreadItem]:
+        """Load the most recent thread items in chronological order."""
+        try:
+            page = await self.store.load_thread_items(
+                thread.id, None, _HISTORY_LIMIT, "desc", context
+            )
+        except NotFoundError:
+            return []
+        return page.data[::-1]
 
     async def _to_agent_input(
         self,
@@ -193,32 +323,10 @@ class HealthCoachServer(ChatKitServer[dict[str, Any]]):
         if _is_tool_completion_item(item):
             return None
 
-        converter = self._thread_item_converter
-        if converter:
-            for method_name in ("to_input_item", "convert", "convert_item", "convert_thread_item"):
-                method = getattr(converter, method_name, None)
-                if not method:
-                    continue
-
-                call_args = [item]
-                call_kwargs = {}
-
-                try:
-                    sig = inspect.signature(method)
-                    params = [
-                        p for p in sig.parameters.values()
-                        if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-                    ]
-                    if len(params) >= 2:
-                        if params[1].kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
-                            call_args.append(thread)
-                        else:
-                            call_kwargs[params[1].name] = thread
-                except (TypeError, ValueError):
-                    pass
-
-                result = method(*call_args, **call_kwargs)
-                return await result if inspect.isawaitable(result) else result
+        convert_item = self._convert_item
+        if convert_item:
+            result = convert_item(item, thread)
+            return await result if inspect.isawaitable(result) else result
 
         if isinstance(item, UserMessageItem):
             return _user_message_text(item)
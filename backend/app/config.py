@@ -11,6 +11,10 @@ SUPERVISOR_AGENT_NAME = "Supervisor"
 PHARMACIST_AGENT_NAME = "Pharmacist"
 PSYCHOLOGIST_AGENT_NAME = "Psychologist"
 
+# Send the thread history to the agents on every turn. The Runner is stateless,
+# so only disable this when the agents get prior turns from elsewhere (e.g. a session).
+INCLUDE_THREAD_HISTORY = True
+
 
 def agent_name_prefix_instruction(agent_name: str) -> str:
     """Generate the generic instruction for agents to prefix their responses with their name in bold."""
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 from chatkit.server import StreamingResult
 from fastapi import Depends, FastAPI, HTTPException, Request, status
@@ -15,13 +16,27 @@ from .chat import (
 )
 from .medications import medication_store
 
-app = FastAPI(title="AI Health Coach API")
 
-_chatkit_server: HealthCoachServer | None = create_chatkit_server()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Build the ChatKit server on startup instead of when the module is imported
+    app.state.chatkit_server = create_chatkit_server()
+    yield
 
 
-def get_chatkit_server() -> HealthCoachServer:
-    if _chatkit_server is None:
+app = FastAPI(title="AI Health Coach API", lifespan=lifespan)
+
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
+def get_chatkit_server(request: Request) -> HealthCoachServer:
+    state = request.app.state
+    if not hasattr(state, "chatkit_server"):
+        # The lifespan did not run (e.g. mounted as a sub-app), so build the server on first use
+        state.chatkit_server = create_chatkit_server()
+
+    server: HealthCoachServer | None = state.chatkit_server
+    if server is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=(
@@ -29,7 +44,7 @@ def get_chatkit_server() -> HealthCoachServer:
                 "package to enable the conversational endpoint."
             ),
         )
-    return _chatkit_server
+    return server
 
 
 @app.post("/chatkit")
@@ -46,9 +61,10 @@ async def chatkit_endpoint(
 
 
 @app.get("/medications")
-async def list_medications() -> dict[str, Any]:
-    medications = await medication_store.list_all()
-    return {"medications": [medication.as_dict() for medication in medications]}
+async def list_medications() -> Response:
+    # The store caches the encoded body until the cabinet changes
+    payload = await medication_store.json_payload()
+    return Response(content=payload, media_type="application/json")
 
 
 @app.delete("/medications/{medication_name}")
@@ -67,5 +83,6 @@ async def clear_all_medications() -> dict[str, Any]:
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
-    return {"status": "healthy"}
+async def health_check() -> Response:
+    # Static body, so skip FastAPI's encoding and validation on every ping
+    return Response(content=_HEALTH_BODY, media_type="application/json")
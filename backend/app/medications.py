@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 
 
+@functools.lru_cache(maxsize=2048)
 def normalize_medication_name(name: str) -> str:
     """Normalize medication name: trim whitespace and convert to title case."""
     return name.strip().title()
@@ -18,63 +21,81 @@ class Medication:
 
     name: str
     created_at: datetime = field(default_factory=datetime.utcnow)
+    _serialized: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)
 
     def as_dict(self) -> dict[str, str]:
-        """Serialize the medication for JSON responses."""
-        return {
-            "name": self.name,
-            "createdAt": self.created_at.isoformat(),
-        }
+        """Serialize the medication for JSON responses (computed once, do not mutate)."""
+        if self._serialized is None:
+            self._serialized = {
+                "name": self.name,
+                "createdAt": self.created_at.isoformat(),
+            }
+        return self._serialized
 
 
 class MedicationStore:
-    """Thread-safe helper that stores medications in memory using names as keys."""
+    """Helper that stores medications in memory using names as keys.
+
+    Operations never await mid-update, so they cannot interleave on the event loop.
+    """
 
     def __init__(self) -> None:
         self._medications: dict[str, Medication] = {}
-        self._lock = asyncio.Lock()
+        # Views derived from the medications, rebuilt lazily after any change
+        self._sorted: list[Medication] | None = None
+        self._payload: bytes | None = None
+
+    def _invalidate(self) -> None:
+        """Drop the derived views after the medications changed."""
+        self._sorted = None
+        self._payload = None
 
     async def create(self, *, name: str) -> Medication:
         """Create or return existing medication with normalized name."""
-        async with self._lock:
-            # Normalize the medication name
-            normalized_name = normalize_medication_name(name)
-            
-            # Check if medication already exists
-            if normalized_name in self._medications:
-                return self._medications[normalized_name]
-            
-            # Create new medication
+        normalized_name = normalize_medication_name(name)
+
+        # Return the existing medication if there is one
+        medication = self._medications.get(normalized_name)
+        if medication is None:
             medication = Medication(name=normalized_name)
             self._medications[normalized_name] = medication
-            return medication
+            self._invalidate()
+        return medication
 
     async def list_all(self) -> list[Medication]:
         """Return all medications sorted by name."""
-        async with self._lock:
-            return sorted(self._medications.values(), key=lambda m: m.name)
+        if self._sorted is None:
+            self._sorted = sorted(self._medications.values(), key=attrgetter("name"))
+        return list(self._sorted)
+
+    async def json_payload(self) -> bytes:
+        """Return the encoded `GET /medications` response body, re-encoded only after changes."""
+        if self._payload is None:
+            medications = await self.list_all()
+            self._payload = json.dumps(
+                {"medications": [medication.as_dict() for medication in medications]},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        return self._payload
 
     async def get(self, name: str) -> Medication | None:
         """Get medication by normalized name."""
-        async with self._lock:
-            normalized_name = normalize_medication_name(name)
-            return self._medications.get(normalized_name)
+        return self._medications.get(normalize_medication_name(name))
 
     async def delete(self, name: str) -> bool:
         """Delete medication by name. Returns True if deleted, False if not found."""
-        async with self._lock:
-            normalized_name = normalize_medication_name(name)
-            if normalized_name in self._medications:
-                del self._medications[normalized_name]
-                return True
+        if self._medications.pop(normalize_medication_name(name), None) is None:
             return False
+        self._invalidate()
+        return True
 
     async def clear_all(self) -> int:
         """Clear all medications. Returns the number of medications that were deleted."""
-        async with self._lock:
-            count = len(self._medications)
-            self._medications.clear()
-            return count
+        count = len(self._medications)
+        self._medications.clear()
+        self._invalidate()
+        return count
 
 
 medication_store = MedicationStore()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from chatkit.store import NotFoundError, Store
 from chatkit.types import Attachment, Page, Thread, ThreadItem, ThreadMetadata
@@ -19,8 +19,10 @@ class _ThreadState:
 class MemoryStore(Store[dict[str, Any]]):
     """Simple in-memory store compatible with the ChatKit server interface."""
 
-    def __init__(self) -> None:
+    def __init__(self, on_thread_deleted: Callable[[str], None] | None = None) -> None:
         self._threads: Dict[str, _ThreadState] = {}
+        # Lets callers drop their own per-thread state when a thread is deleted
+        self._on_thread_deleted = on_thread_deleted
         # Attachments intentionally unsupported; use a real store that enforces auth.
 
     @staticmethod
@@ -85,6 +87,8 @@ class MemoryStore(Store[dict[str, Any]]):
 
     async def delete_thread(self, thread_id: str, context: dict[str, Any]) -> None:
         self._threads.pop(thread_id, None)
+        if self._on_thread_deleted is not None:
+            self._on_thread_deleted(thread_id)
 
     # -- Thread items ----------------------------------------------------
     def _items(self, thread_id: str) -> List[ThreadItem]:
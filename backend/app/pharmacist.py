@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from agents import Agent, RunContextWrapper, function_tool
 from chatkit.agents import AgentContext
@@ -11,6 +12,8 @@ from chatkit.agents import AgentContext
 from .config import MODEL, PHARMACIST_AGENT_NAME, agent_name_prefix_instruction
 from .medications import medication_store
 
+logger = logging.getLogger(__name__)
+
 
 PHARMACIST_INSTRUCTIONS = f"""You are a pharmacist who manages a medicine cabinet (use your tools to inspect and manage the contents).
 If users report symptoms treatable with current medications, suggest the appropriate medication and dosage.
@@ -18,88 +21,96 @@ Be very careful with advice and suggest consulting a healthcare provider for ser
 
 {agent_name_prefix_instruction(PHARMACIST_AGENT_NAME)}"""
 
+_ToolFunc = Callable[..., Awaitable[dict[str, Any]]]
+
+
+def _tool_errors(log_message: str, error_message: str) -> Callable[[_ToolFunc], _ToolFunc]:
+    """Log tool failures and report them to the agent as an error payload."""
+
+    def decorator(func: _ToolFunc) -> _ToolFunc:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                logger.exception(log_message)
+                return {"error": error_message}
+
+        return wrapper
+
+    return decorator
+
 
 @function_tool(description_override="List all medications in the patient's medicine cabinet. Use this to see what medications the patient currently has.")
+@_tool_errors("Failed to list medications", "Failed to retrieve medications")
 async def list_medications(
     _ctx: RunContextWrapper[AgentContext],
 ) -> dict[str, Any]:
     """List all medications in the medicine cabinet."""
-    try:
-        medications = await medication_store.list_all()
-        return {
-            "medications": [medication.as_dict() for medication in medications],
-            "count": len(medications)
-        }
-    except Exception:
-        logging.exception("Failed to list medications")
-        return {"error": "Failed to retrieve medications"}
+    medications = await medication_store.list_all()
+    return {
+        "medications": [medication.as_dict() for medication in medications],
+        "count": len(medications)
+    }
 
 
 @function_tool(description_override="Add a new medication to the patient's medicine cabinet. Use this when the patient mentions taking, buying, or using a new medication.")
+@_tool_errors("Failed to add medication", "Failed to add medication")
 async def add_medication(
     _ctx: RunContextWrapper[AgentContext],
     medication_name: str,
 ) -> dict[str, Any]:
     """Add a medication to the medicine cabinet."""
-    try:
-        medication = await medication_store.create(name=medication_name)
-        return {
-            "medication_name": medication.name,
-            "status": "added",
-            "created_at": medication.created_at.isoformat()
-        }
-    except Exception:
-        logging.exception("Failed to add medication")
-        return {"error": "Failed to add medication"}
+    medication = await medication_store.create(name=medication_name)
+    return {
+        "medication_name": medication.name,
+        "status": "added",
+        "created_at": medication.as_dict()["createdAt"]
+    }
 
 
 @function_tool(description_override="Get information about a specific medication in the patient's medicine cabinet.")
+@_tool_errors("Failed to get medication", "Failed to retrieve medication")
 async def get_medication(
     _ctx: RunContextWrapper[AgentContext],
     medication_name: str,
 ) -> dict[str, Any]:
     """Get information about a specific medication."""
-    try:
-        medication = await medication_store.get(medication_name)
-        if medication:
-            return {
-                "found": True,
-                "medication": medication.as_dict()
-            }
-        else:
-            return {
-                "found": False,
-                "message": f"Medication '{medication_name}' not found in medicine cabinet"
-            }
-    except Exception:
-        logging.exception("Failed to get medication")
-        return {"error": "Failed to retrieve medication"}
+    medication = await medication_store.get(medication_name)
+    if medication:
+        return {
+            "found": True,
+            "medication": medication.as_dict()
+        }
+    else:
+        return {
+            "found": False,
+            "message": f"Medication '{medication_name}' not found in medicine cabinet"
+        }
 
 
 @function_tool(description_override="Remove a medication from the patient's medicine cabinet. Use this when the patient stops taking a medication.")
+@_tool_errors("Failed to remove medication", "Failed to remove medication")
 async def remove_medication(
     _ctx: RunContextWrapper[AgentContext],
     medication_name: str,
 ) -> dict[str, Any]:
     """Remove a medication from the medicine cabinet."""
-    try:
-        deleted = await medication_store.delete(medication_name)
-        if deleted:
-            return {
-                "medication_name": medication_name,
-                "status": "removed"
-            }
-        else:
-            return {
-                "medication_name": medication_name,
-                "status": "not_found",
-                "message": f"Medication '{medication_name}' was not found in the medicine cabinet"
-            }
-    except Exception:
-        logging.exception("Failed to remove medication")
-        return {"error": "Failed to remove medication"}
+    deleted = await medication_store.delete(medication_name)
+    if deleted:
+        return {
+            "medication_name": medication_name,
+            "status": "removed"
+        }
+    else:
+        return {
+            "medication_name": medication_name,
+            "status": "not_found",
+            "message": f"Medication '{medication_name}' was not found in the medicine cabinet"
+        }
 
 
+@functools.cache
 def create_pharmacist_agent() -> Agent[AgentContext]:
     """Create the pharmacist agent specialized in medication management."""
     return Agent(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from agents import Agent
 from chatkit.agents import AgentContext
 
@@ -14,6 +16,7 @@ For serious mental health crises, encourage immediate professional help.
 {agent_name_prefix_instruction(PSYCHOLOGIST_AGENT_NAME)}"""
 
 
+@functools.cache
 def create_psychologist_agent() -> Agent[AgentContext]:
     """Create the psychologist agent specialized in mental health support."""
     return Agent(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Final
 
@@ -10,9 +11,25 @@ from chatkit.agents import AgentContext, ClientToolCall
 
 from .config import MODEL, SUPERVISOR_AGENT_NAME, agent_name_prefix_instruction
 
+logger = logging.getLogger(__name__)
+
 # NOTE: Must match frontend tool name
 CLIENT_THEME_TOOL_NAME: Final[str] = "switch_theme"
 SUPPORTED_COLOR_SCHEMES: Final[frozenset[str]] = frozenset({"light", "dark"})
+# Exact inputs mapped to their color scheme, checked before the substring fallback
+_COLOR_SCHEME_ALIASES: Final[dict[str, str]] = {
+    **{scheme: scheme for scheme in SUPPORTED_COLOR_SCHEMES},
+    "l": "light",
+    "d": "dark",
+}
+# Only two outcomes are possible, so the tool calls and results are built once and shared
+_THEME_TOOL_CALLS: Final[dict[str, ClientToolCall]] = {
+    scheme: ClientToolCall(name=CLIENT_THEME_TOOL_NAME, arguments={"theme": scheme})
+    for scheme in SUPPORTED_COLOR_SCHEMES
+}
+_THEME_RESULTS: Final[dict[str, dict[str, str]]] = {
+    scheme: {"theme": scheme} for scheme in SUPPORTED_COLOR_SCHEMES
+}
 
 
 SUPERVISOR_INSTRUCTIONS = f"""You are a supervisor that routes user queries to appropriate specialists.
@@ -22,11 +39,13 @@ You can also handle basic UI requests using your tools.
 {agent_name_prefix_instruction(SUPERVISOR_AGENT_NAME)}"""
 
 
+@functools.lru_cache(maxsize=32)
 def _normalize_color_scheme(value: str) -> str:
     """Normalize color scheme input to 'light' or 'dark'."""
     normalized = str(value).strip().lower()
-    if normalized in SUPPORTED_COLOR_SCHEMES:
-        return normalized
+    scheme = _COLOR_SCHEME_ALIASES.get(normalized)
+    if scheme is not None:
+        return scheme
     if "dark" in normalized:
         return "dark"
     if "light" in normalized:
@@ -42,28 +61,44 @@ async def switch_theme(
     theme: str,
 ) -> dict[str, str] | None:
     """Switch the chat interface theme between light and dark modes."""
-    logging.debug(f"Switching theme to {theme}")
+    logger.debug("Switching theme to %s", theme)
     try:
         requested = _normalize_color_scheme(theme)
-        ctx.context.client_tool_call = ClientToolCall(
-            name=CLIENT_THEME_TOOL_NAME,
-            arguments={"theme": requested},
-        )
-        return {"theme": requested}
+        ctx.context.client_tool_call = _THEME_TOOL_CALLS[requested]
+        return _THEME_RESULTS[requested]
     except Exception:
-        logging.exception("Failed to switch theme")
+        logger.exception("Failed to switch theme")
         return None
 
 
+# Supervisors already built, keyed by the identity of their delegate agents. The delegates
+# are kept in the entry so their ids cannot be reused by other objects while cached.
+_SUPERVISOR_CACHE_SIZE: Final[int] = 8
+_supervisor_cache: dict[
+    tuple[int, ...], tuple[tuple[Agent[AgentContext], ...], Agent[AgentContext]]
+] = {}
+
+
 def create_supervisor_agent(handoffDelegateAgents: list[Agent[AgentContext]]) -> Agent[AgentContext]:
     """Create a generic supervisor agent that routes queries to provided agents."""
+    delegates = tuple(handoffDelegateAgents)
+    key = tuple(id(agent) for agent in delegates)
+    cached = _supervisor_cache.get(key)
+    if cached is not None:
+        return cached[1]
+
     # Create handoffs - the agent name will be included in the tool call by default
-    handoffs = [handoff(agent) for agent in handoffDelegateAgents]
+    handoffs = [handoff(agent) for agent in delegates]
     
-    return Agent(
+    supervisor = Agent(
         name=SUPERVISOR_AGENT_NAME,
         model=MODEL,
         instructions=SUPERVISOR_INSTRUCTIONS,
         tools=[switch_theme],
         handoffs=handoffs,
     )
+    if len(_supervisor_cache) >= _SUPERVISOR_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _supervisor_cache[next(iter(_supervisor_cache))]
+    _supervisor_cache[key] = (delegates, supervisor)
+    return supervisor